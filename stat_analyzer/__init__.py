@@ -2,7 +2,8 @@ from .config import (
     PROJECT_ROOT,
     DATA_DIR,
     RAW_DATA_FILE,
-    PROCESSED_DATA_FILE
+    PROCESSED_DATA_FILE,
+    PROCESSED_SCHEMA_FILE
 )
 
 from .eda import (
@@ -15,8 +16,17 @@ from .eda import (
     correlation_matrix
 )
 
+from .cleaning import (
+    VGSALES_SCHEMA,
+    clean_chunk,
+    run_cleaning,
+    load_processed_data,
+    load_clean_data
+)
+
 from . import ai
 from . import hypothesis_tests
+from . import models
 
 __all__ = [
     # Config keys
@@ -24,6 +34,7 @@ __all__ = [
     "DATA_DIR",
     "RAW_DATA_FILE",
     "PROCESSED_DATA_FILE",
+    "PROCESSED_SCHEMA_FILE",
     # EDA functions
     "load_data",
     "save_processed_data",
@@ -32,7 +43,14 @@ __all__ = [
     "numerical_summary",
     "categorical_summary",
     "correlation_matrix",
+    # Cleaning pipeline
+    "VGSALES_SCHEMA",
+    "clean_chunk",
+    "run_cleaning",
+    "load_processed_data",
+    "load_clean_data",
     # Sub-packages
     "ai",
     "hypothesis_tests",
+    "models",
 ]
\ No newline at end of file
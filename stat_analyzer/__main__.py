@@ -1,6 +1,7 @@
 import sys
 import pandas as pd
-from .eda import load_data, basic_info, numerical_summary, categorical_summary, correlation_matrix
+from .eda import basic_info, numerical_summary, categorical_summary, correlation_matrix
+from .cleaning import load_clean_data
 from .hypothesis_tests import (HYPOTHESES, run_test_by_name, suggest_tests)
 from stat_analyzer.ai.ai_agent import recommend_tests_from_hypothesis
 from stat_analyzer.hypothesis_tests.runner import load_custom_test
@@ -14,8 +15,8 @@ from .hypothesis_tests.plots import (
 
 
 def load_dataset() -> pd.DataFrame:
-    """Load dataset from eda.py"""
-    df = load_data()
+    """Load the typed processed dataset, building it from the raw CSV if needed"""
+    df = load_clean_data()
     return df
 
 def print_columns(df: pd.DataFrame) -> None:
@@ -167,6 +168,13 @@ def run_plots(df: pd.DataFrame) -> None:
         else:
             print("Некоректний вибір.")
 
+def run_report() -> None:
+    """Builds the full HTML report with EDA, presets and plots."""
+    from .report import build_report
+    print("\nГенерую звіт... Незмінені розділи беруться з кешу.")
+    path = build_report()
+    print(f"Звіт збережено: {path}")
+
 def print_menu() -> None:
     """Displays the main application menu."""
     print("\n=== Меню аналізу vgsales ===")
@@ -174,6 +182,7 @@ def print_menu() -> None:
     print("2. Перевірити власну гіпотезу (обрати змінні)")
     print("3. Запустити всі наперед задані гіпотези")
     print("4. Побудувати графіки")
+    print("5. Згенерувати звіт (HTML)")
     print("0. Вихід")
 
 def main() -> None:
@@ -190,6 +199,8 @@ def main() -> None:
             run_presets(df)
         elif choice == "4":
             run_plots(df)
+        elif choice == "5":
+            run_report()
         elif choice == "0":
             print("Завершення роботи.")
             sys.exit(0)
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from .config import RAW_DATA_FILE, PROCESSED_DATA_FILE, PROCESSED_SCHEMA_FILE
+from .eda import save_processed_data
+
+DEFAULT_CHUNKSIZE = 5000
+NA_TOKENS = ["", "N/A", "n/a", "NA", "nan", "NaN", "null", "None", "-"]
+
+# Декларативні правила очищення для кожної колонки:
+#   dtype     цільовий тип (float64, int32, Int16, category, string)
+#   missing   keep | drop | fill (разом з fill_value)
+#   normalize обрізати пробіли і звести NA токени до пропуску
+#   outliers  iqr додає колонку <col>_outlier з прапорцем викиду
+VGSALES_SCHEMA: dict[str, dict] = {
+    "Rank": {"dtype": "int32", "missing": "drop"},
+    "Name": {"dtype": "string", "normalize": True, "missing": "drop"},
+    "Platform": {"dtype": "category", "normalize": True, "missing": "drop"},
+    "Year": {"dtype": "Int16", "missing": "keep"},
+    "Genre": {"dtype": "category", "normalize": True, "missing": "drop"},
+    "Publisher": {"dtype": "category", "normalize": True,
+                  "missing": "fill", "fill_value": "Unknown"},
+    "NA_Sales": {"dtype": "float64", "missing": "keep"},
+    "EU_Sales": {"dtype": "float64", "missing": "keep"},
+    "JP_Sales": {"dtype": "float64", "missing": "keep"},
+    "Other_Sales": {"dtype": "float64", "missing": "keep"},
+    "Global_Sales": {"dtype": "float64", "missing": "keep", "outliers": "iqr"},
+}
+
+
+def _is_numeric_rule(rule: dict) -> bool:
+    return rule["dtype"] not in ("category", "string")
+
+
+def _coerce(values: pd.Series, rule: dict) -> pd.Series:
+    """Vectorized normalization and numeric coercion of one raw string column."""
+    if rule.get("normalize"):
+        values = values.str.strip()
+        values = values.mask(values.isin(NA_TOKENS))
+    if not _is_numeric_rule(rule):
+        return values
+    numbers = pd.to_numeric(values, errors="coerce")
+    if rule["dtype"].lower().startswith("int"):
+        # Дробові значення (наприклад 2006.5) не є валідними цілими
+        numbers = numbers.where(numbers == np.floor(numbers))
+    return numbers
+
+
+def _outlier_bounds(raw_path: Path, schema: dict,
+                    chunksize: int) -> dict[str, tuple[float, float]]:
+    """
+    First pass: IQR fences for columns with an outlier rule.
+    Exception to chunk streaming: exact quartiles need every value, so each outlier
+    column is held in memory as float64 (8 bytes per row) until the quantiles are computed.
+    """
+    columns = [c for c, rule in schema.items() if rule.get("outliers") == "iqr"]
+    if not columns:
+        return {}
+    parts: dict[str, list[np.ndarray]] = {c: [] for c in columns}
+    for chunk in pd.read_csv(raw_path, usecols=columns, dtype=str,
+                             keep_default_na=False, chunksize=chunksize):
+        for col in columns:
+            parts[col].append(_coerce(chunk[col], schema[col]).to_numpy(dtype=float))
+    bounds = {}
+    for col in columns:
+        q1, q3 = np.nanquantile(np.concatenate(parts[col]), [0.25, 0.75])
+        bounds[col] = (q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+    return bounds
+
+
+def clean_chunk(chunk: pd.DataFrame, schema: dict = VGSALES_SCHEMA,
+                bounds: dict[str, tuple[float, float]] | None = None) -> pd.DataFrame:
+    """Applies coercion, missing-value policy and outlier flags to one raw chunk."""
+    out = {}
+    for col, rule in schema.items():
+        out[col] = _coerce(chunk[col], rule)
+    cleaned = pd.DataFrame(out, index=chunk.index)
+
+    drop_cols = [c for c, rule in schema.items() if rule.get("missing") == "drop"]
+    if drop_cols:
+        cleaned = cleaned.dropna(subset=drop_cols)
+    fills = {c: rule["fill_value"] for c, rule in schema.items()
+             if rule.get("missing") == "fill"}
+    if fills:
+        cleaned = cleaned.fillna(fills)
+    numeric = {c: rule["dtype"] for c, rule in schema.items() if _is_numeric_rule(rule)}
+    cleaned = cleaned.astype(numeric)
+
+    for col, (low, high) in (bounds or {}).items():
+        values = cleaned[col]
+        cleaned[f"{col}_outlier"] = ((values < low) | (values > high)).astype("boolean")
+    return cleaned
+
+
+def schema_hash(schema: dict = VGSALES_SCHEMA) -> str:
+    """Hash of the cleaning rules; a changed schema makes the processed file stale."""
+    payload = json.dumps({"schema": schema, "na_tokens": NA_TOKENS},
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_schema_dtypes(schema: dict, categories: dict[str, set]) -> dict[str, str | dict]:
+    """JSON-serializable dtype description of the processed file."""
+    dtypes: dict[str, str | dict] = {}
+    for col, rule in schema.items():
+        if rule["dtype"] == "category":
+            dtypes[col] = {"category": sorted(categories[col])}
+        else:
+            dtypes[col] = rule["dtype"]
+        if rule.get("outliers"):
+            dtypes[f"{col}_outlier"] = "boolean"
+    return dtypes
+
+
+def run_cleaning(raw_path: Path | str = RAW_DATA_FILE,
+                 out_path: Path | str = PROCESSED_DATA_FILE,
+                 schema_path: Path | str = PROCESSED_SCHEMA_FILE,
+                 schema: dict = VGSALES_SCHEMA,
+                 chunksize: int = DEFAULT_CHUNKSIZE) -> dict[str, int]:
+    """
+    Streams the raw CSV through clean_chunk and writes the processed CSV once,
+    together with a JSON dtype schema used by load_processed_data.
+    Both files are written to temporary paths and replaced only after success.
+    Returns row counts {"rows_in", "rows_out"}.
+    """
+    raw_path, out_path, schema_path = Path(raw_path), Path(out_path), Path(schema_path)
+    tmp_out = out_path.with_name(out_path.name + ".tmp")
+    tmp_schema = schema_path.with_name(schema_path.name + ".tmp")
+    try:
+        bounds = _outlier_bounds(raw_path, schema, chunksize)
+        categories: dict[str, set] = {c: set() for c, rule in schema.items()
+                                      if rule["dtype"] == "category"}
+        rows_in = rows_out = 0
+        first = True
+        for chunk in pd.read_csv(raw_path, usecols=list(schema), dtype=str,
+                                 keep_default_na=False, chunksize=chunksize):
+            cleaned = clean_chunk(chunk, schema, bounds)
+            for col in categories:
+                categories[col].update(cleaned[col].dropna().unique())
+            # Перший chunk перезаписує файл, наступні дописуються без заголовка
+            save_processed_data(cleaned, tmp_out, append=not first)
+            first = False
+            rows_in += len(chunk)
+            rows_out += len(cleaned)
+
+        # Розмір файлу у схемі пов'язує схему саме з цією версією даних
+        meta = {
+            "schema_hash": schema_hash(schema),
+            "data_bytes": tmp_out.stat().st_size,
+            "dtypes": build_schema_dtypes(schema, categories),
+        }
+        tmp_schema.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_schema, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_out, out_path)
+        os.replace(tmp_schema, schema_path)
+    finally:
+        tmp_out.unlink(missing_ok=True)
+        tmp_schema.unlink(missing_ok=True)
+    return {"rows_in": rows_in, "rows_out": rows_out}
+
+
+def load_processed_data(path: Path | str = PROCESSED_DATA_FILE,
+                        schema_path: Path | str = PROCESSED_SCHEMA_FILE) -> pd.DataFrame:
+    """Loads the processed CSV with the dtypes stored by run_cleaning, without re-casting."""
+    with open(schema_path, "r", encoding="utf-8") as f:
+        stored = json.load(f)
+    dtypes = {}
+    for col, dtype in stored["dtypes"].items():
+        if isinstance(dtype, dict):
+            dtypes[col] = pd.CategoricalDtype(dtype["category"])
+        else:
+            dtypes[col] = dtype
+    # Пропуски у файлі записані як порожні рядки, інші токени вже нормалізовані
+    return pd.read_csv(Path(path), dtype=dtypes, keep_default_na=False, na_values=[""])
+
+
+def _is_stale(raw_path: Path, path: Path, schema_path: Path, schema: dict) -> bool:
+    """The processed file is stale if missing, older than raw, truncated or built by other rules."""
+    if not path.exists() or not schema_path.exists():
+        return True
+    if path.stat().st_mtime < raw_path.stat().st_mtime:
+        return True
+    try:
+        with open(schema_path, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return True
+    return (stored.get("schema_hash") != schema_hash(schema)
+            or stored.get("data_bytes") != path.stat().st_size)
+
+
+def load_clean_data(raw_path: Path | str = RAW_DATA_FILE,
+                    path: Path | str = PROCESSED_DATA_FILE,
+                    schema_path: Path | str = PROCESSED_SCHEMA_FILE,
+                    schema: dict = VGSALES_SCHEMA) -> pd.DataFrame:
+    """Loads the processed dataset, running the cleaning pipeline first if it is missing or stale."""
+    path, schema_path, raw_path = Path(path), Path(schema_path), Path(raw_path)
+    if _is_stale(raw_path, path, schema_path, schema):
+        run_cleaning(raw_path, path, schema_path, schema)
+    return load_processed_data(path, schema_path)
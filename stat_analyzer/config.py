@@ -10,6 +10,9 @@ RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 RAW_DATA_FILE = RAW_DATA_DIR / "vgsales.csv"
 PROCESSED_DATA_FILE = PROCESSED_DATA_DIR / "vgsales_clean.csv"
+PROCESSED_SCHEMA_FILE = PROCESSED_DATA_DIR / "vgsales_clean.schema.json"
+REPORTS_DIR = PROJECT_ROOT / "reports"
+REPORT_CACHE_DIR = REPORTS_DIR / ".cache"
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 OPENROUTER_URL = os.getenv("OPENROUTER_URL")
 # print("DEBUG OPENROUTER_API_KEY:", repr(GEMINI_API_KEY))
\ No newline at end of file
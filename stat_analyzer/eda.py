@@ -10,12 +10,14 @@ def load_data(path: Path | str = RAW_DATA_FILE) -> pd.DataFrame:
 
 def save_processed_data(df: pd.DataFrame,
                         path: Path | str = PROCESSED_DATA_FILE,
-                        index: bool = False) -> None:
+                        index: bool = False,
+                        append: bool = False) -> None:
     """Saves the DataFrame to a CSV file, creating directories if necessary."""
     # Створення батьківської папки, якщо вона відсутня
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=index)
+    # append дописує рядки без заголовка (потокове збереження по частинах)
+    df.to_csv(path, index=index, mode="a" if append else "w", header=not append)
 
 def list_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Returns a summary DataFrame of column names and their data types."""
@@ -8,6 +8,7 @@ from stat_analyzer.hypothesis_tests.runner import (
 from .runner import load_custom_test
 from .runner import TEST_FUNCTIONS
 from .presets import HYPOTHESES
+from .ranks import clear_rank_cache
 
 __all__ = [
     "detect_type",
@@ -17,4 +18,5 @@ __all__ = [
     "interpret_result",
     "run_all_presets",
     "HYPOTHESES",
+    "clear_rank_cache",
 ]
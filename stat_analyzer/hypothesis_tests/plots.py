@@ -3,7 +3,16 @@ import seaborn as sns
 import pandas as pd
 sns.set(style="whitegrid")
 
-def plot_histogram(df: pd.DataFrame, column: str, bins: int = 30) -> None:
+def _finish(show: bool) -> plt.Figure:
+    """Shows the current figure or returns it for saving (e.g. into a report)."""
+    fig = plt.gcf()
+    if show:
+        plt.show()
+    return fig
+
+
+def plot_histogram(df: pd.DataFrame, column: str, bins: int = 30,
+                   show: bool = True) -> plt.Figure:
     """Plots a histogram for a numerical variable with a KDE curve."""
     # Побудова гістограми числової змінної.
     plt.figure(figsize=(8, 5))
@@ -11,19 +20,20 @@ def plot_histogram(df: pd.DataFrame, column: str, bins: int = 30) -> None:
     plt.title(f"Histogram of {column}")
     plt.xlabel(column)
     plt.ylabel("Frequency")
-    plt.show()
+    return _finish(show)
 
 
-def plot_boxplot(df: pd.DataFrame, column: str) -> None:
+def plot_boxplot(df: pd.DataFrame, column: str, show: bool = True) -> plt.Figure:
     """Generates a boxplot to visualize distribution and outliers."""
     # Бохсплот для виявлення викидів.
     plt.figure(figsize=(6, 4))
     sns.boxplot(x=df[column])
     plt.title(f"Boxplot of {column}")
-    plt.show()
+    return _finish(show)
 
 
-def plot_correlation_heatmap(df: pd.DataFrame, columns: str = None) -> None:
+def plot_correlation_heatmap(df: pd.DataFrame, columns: str = None,
+                             show: bool = True) -> plt.Figure:
     """Visualizes the correlation matrix as a heatmap."""
     # Теплова карта кореляції.
     if columns:
@@ -33,25 +43,28 @@ def plot_correlation_heatmap(df: pd.DataFrame, columns: str = None) -> None:
     plt.figure(figsize=(10, 8))
     sns.heatmap(data.corr(), annot=True, cmap="coolwarm")
     plt.title("Correlation Heatmap")
-    plt.show()
+    return _finish(show)
 
 
-def plot_bar_counts(df: pd.DataFrame, column: str, top_n: int = 10) -> None:
+def plot_bar_counts(df: pd.DataFrame, column: str, top_n: int = 10,
+                    show: bool = True) -> plt.Figure:
     """Plots a bar chart for the top N frequent categories."""
     # Barplot частот категоріальної змінної.
     counts = df[column].value_counts().head(top_n)
     plt.figure(figsize=(8, 5))
-    sns.barplot(x=counts.values, y=counts.index)
+    # astype(str): для category колонок seaborn малював би і порожні категорії
+    sns.barplot(x=counts.values, y=counts.index.astype(str))
     plt.title(f"Top {top_n} categories of {column}")
     plt.xlabel("Count")
     plt.ylabel(column)
-    plt.show()
+    return _finish(show)
 
 
-def plot_pairplot(df: pd.DataFrame, columns: str = None) -> None:
+def plot_pairplot(df: pd.DataFrame, columns: str = None,
+                  show: bool = True) -> plt.Figure:
     """Generates a pairplot to visualize relationships between numerical variables."""
     if columns:
         sns.pairplot(df[columns])
     else:
         sns.pairplot(df)
-    plt.show()
\ No newline at end of file
+    return _finish(show)
\ No newline at end of file
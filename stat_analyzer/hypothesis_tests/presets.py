@@ -19,4 +19,17 @@ HYPOTHESES = [
         "cols": ["Genre", "Platform"],
         "description": "Чи пов'язані між собою жанр гри і платформа",
     },
+    {
+        "name": "genre_platform_year_vs_global_sales",
+        "model": "ancova",
+        "formula": "Global_Sales ~ Genre + Platform + Year",
+        "description": "Чи пояснюють жанр, платформа і рік разом глобальні продажі",
+    },
+    {
+        "name": "hit_vs_genre_platform_year",
+        "model": "logit",
+        "formula": "Global_Sales ~ Genre + Platform + Year",
+        "threshold": 1.0,
+        "description": "Чи залежить ймовірність хіта (понад 1 млн продажів) від жанру, платформи і року",
+    },
 ]
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+# Кеш сортування по колонках: column -> {"values", "order", "sorted", ...}
+_RANK_CACHE: dict[str, dict] = {}
+
+
+def clear_rank_cache(column: str | None = None) -> None:
+    """Drops cached sort orders for one column or for all of them."""
+    if column is None:
+        _RANK_CACHE.clear()
+    else:
+        _RANK_CACHE.pop(column, None)
+
+
+def _column_entry(df: pd.DataFrame, column: str) -> dict:
+    """Returns the cached sort order for a column, rebuilding it if the data changed."""
+    # to_numpy може повернути view буфера DataFrame; без копії зміна df in-place
+    # змінила б і збережене значення, і кеш не інвалідувався б
+    values = df[column].to_numpy(dtype=float)
+    entry = _RANK_CACHE.get(column)
+    if (entry is not None
+            and entry["values"].shape == values.shape
+            and np.array_equal(entry["values"], values, equal_nan=True)):
+        return entry
+    # Єдине O(n log n) місце: стабільне сортування, NaN опиняються в кінці
+    order = np.argsort(values, kind="mergesort")
+    entry = {
+        "values": values.copy(),
+        "order": order,
+        "sorted": values[order],
+        "has_nan": bool(np.isnan(values).any()),
+    }
+    _RANK_CACHE[column] = entry
+    return entry
+
+
+def _average_ranks(sorted_values: np.ndarray) -> tuple[np.ndarray, float]:
+    """Average ranks and the sum(t^3 - t) tie term for an already sorted array."""
+    m = len(sorted_values)
+    if m == 0:
+        return np.empty(0), 0.0
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    counts = np.diff(np.r_[starts, m])
+    avg = starts + (counts + 1) / 2.0
+    tie_term = float(np.sum(counts.astype(float) ** 3 - counts))
+    return np.repeat(avg, counts), tie_term
+
+
+def column_ranks(df: pd.DataFrame, column: str,
+                 mask: np.ndarray | None = None) -> tuple[np.ndarray, float, bool]:
+    """
+    Ranks the rows of a column selected by mask in O(n) using the cached order.
+    Returns (ranks, tie_term, has_nan); ranks are NaN outside the mask.
+    """
+    entry = _column_entry(df, column)
+    values = entry["values"]
+    if mask is None:
+        if "ranks" not in entry:
+            entry["ranks"], entry["tie_term"] = _subset_ranks(entry, None)
+        return entry["ranks"], entry["tie_term"], entry["has_nan"]
+    has_nan = bool(np.isnan(values[mask]).any())
+    ranks, tie_term = _subset_ranks(entry, mask)
+    return ranks, tie_term, has_nan
+
+
+def _subset_ranks(entry: dict, mask: np.ndarray | None) -> tuple[np.ndarray, float]:
+    """Scatters average ranks of the selected non-NaN rows back to row order."""
+    order = entry["order"]
+    sorted_values = entry["sorted"]
+    keep = ~np.isnan(sorted_values)
+    if mask is not None:
+        keep &= mask[order]
+    ranks_sorted, tie_term = _average_ranks(sorted_values[keep])
+    ranks = np.full(len(order), np.nan)
+    ranks[order[keep]] = ranks_sorted
+    return ranks, tie_term
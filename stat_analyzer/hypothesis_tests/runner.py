@@ -2,6 +2,7 @@ import json
 import pandas as pd
 from .detectors import detect_type, suggest_tests
 from . import tests as test_impl
+from ..models import run_model_preset, format_model_summary
 
 data = pd.read_csv("data/raw/vgsales.csv")
 
@@ -81,6 +82,12 @@ def run_all_presets(df, presets, auto=True):
     """Iterates through a list of hypothesis presets and generates reports."""
     reports = []
     for hypothesis in presets:
+        if "formula" in hypothesis:
+            # Багатофакторні моделі замість тесту для пари колонок
+            description = hypothesis.get("description", f"Модель {hypothesis['formula']}")
+            result = run_model_preset(df, hypothesis)
+            reports.append(interpret_result(description, result) + "\n" + format_model_summary(result))
+            continue
         cols = hypothesis["cols"]
         description = hypothesis.get("description", f"Гіпотеза для {cols}")
         col1, col2 = cols[0], cols[1]
@@ -1,12 +1,14 @@
+import numpy as np
 import pandas as pd
 from scipy import stats
+from .ranks import column_ranks
 
 ResultDict = dict[str, float]
 def run_pearson(df: pd.DataFrame, col1: str,
                 col2: str) -> ResultDict:
     """Calculates Pearson correlation coefficient."""
-    x = df[col1].astype(float)
-    y = df[col2].astype(float)
+    x = df[col1].to_numpy(dtype=float)
+    y = df[col2].to_numpy(dtype=float)
     stat, p = stats.pearsonr(x, y)
     return {
         "test": "pearson",
@@ -16,10 +18,17 @@ def run_pearson(df: pd.DataFrame, col1: str,
 
 def run_spearman(df: pd.DataFrame, col1: str,
                  col2: str) -> ResultDict:
-    """Calculates Spearman rank correlation."""
-    x = df[col1].astype(float)
-    y = df[col2].astype(float)
-    stat, p = stats.spearmanr(x, y)
+    """Calculates Spearman rank correlation from cached column ranks."""
+    rx, _, nan_x = column_ranks(df, col1)
+    ry, _, nan_y = column_ranks(df, col2)
+    n = len(rx)
+    if nan_x or nan_y or n < 3:
+        stat = p = float("nan")
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stat = np.corrcoef(rx, ry)[0, 1]
+            t = stat * np.sqrt((n - 2) / ((stat + 1.0) * (1.0 - stat)))
+        p = 2 * stats.t.sf(abs(t), n - 2)
     return {
         "test": "spearman",
         "statistic": float(stat),
@@ -29,11 +38,12 @@ def run_spearman(df: pd.DataFrame, col1: str,
 def run_ttest_ind(df: pd.DataFrame, group_col: str,
                   target_col: str) -> ResultDict:
     """Performs independent samples t-test."""
-    groups = df[group_col].dropna().unique()
+    codes, groups = pd.factorize(df[group_col])
     if len(groups) != 2:
         raise ValueError("t тест вимагає рівно дві групи")
-    g1 = df[df[group_col] == groups[0]][target_col].astype(float)
-    g2 = df[df[group_col] == groups[1]][target_col].astype(float)
+    values = df[target_col].to_numpy(dtype=float)
+    g1 = values[codes == 0]
+    g2 = values[codes == 1]
     stat, p = stats.ttest_ind(g1, g2, equal_var=False, nan_policy="omit")
     return {
         "test": "ttest",
@@ -43,13 +53,30 @@ def run_ttest_ind(df: pd.DataFrame, group_col: str,
 
 def run_mannwhitney(df: pd.DataFrame, group_col: str,
                     target_col: str,) -> ResultDict:
-    """Performs Mann-Whitney U test (non-parametric)."""
-    groups = df[group_col].dropna().unique()
+    """Performs Mann-Whitney U test (non-parametric) on cached ranks."""
+    codes, groups = pd.factorize(df[group_col])
     if len(groups) != 2:
         raise ValueError("Mann Whitney вимагає рівно дві групи")
-    g1 = df[df[group_col] == groups[0]][target_col].astype(float)
-    g2 = df[df[group_col] == groups[1]][target_col].astype(float)
-    stat, p = stats.mannwhitneyu(g1, g2, alternative="two-sided")
+    mask = codes >= 0
+    ranks, tie_term, has_nan = column_ranks(df, target_col, mask)
+    n1 = int(np.count_nonzero(codes == 0))
+    n2 = int(np.count_nonzero(codes == 1))
+    if has_nan:
+        stat = p = float("nan")
+    elif (n1 <= 8 or n2 <= 8) and tie_term == 0:
+        # Малі вибірки без зв'язків: точний розподіл рахує SciPy
+        values = df[target_col].to_numpy(dtype=float)
+        stat, p = stats.mannwhitneyu(values[codes == 0], values[codes == 1],
+                                     alternative="two-sided")
+    else:
+        # Нормальна апроксимація з поправкою на зв'язки та неперервність
+        stat = ranks[codes == 0].sum() - n1 * (n1 + 1) / 2
+        u = max(stat, n1 * n2 - stat)
+        n = n1 + n2
+        s = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (u - n1 * n2 / 2 - 0.5) / s
+        p = min(max(2 * stats.norm.sf(z), 0.0), 1.0)
     return {
         "test": "mannwhitney",
         "statistic": float(stat),
@@ -59,9 +86,9 @@ def run_mannwhitney(df: pd.DataFrame, group_col: str,
 def run_anova(df: pd.DataFrame, group_col: str,
               target_col: str) -> ResultDict:
     """Performs one-way ANOVA test."""
-    groups = []
-    for g in df[group_col].dropna().unique():
-        groups.append(df[df[group_col] == g][target_col].astype(float))
+    codes, uniques = pd.factorize(df[group_col])
+    values = df[target_col].to_numpy(dtype=float)
+    groups = [values[codes == j] for j in range(len(uniques))]
     if len(groups) < 2:
         raise ValueError("ANOVA вимагає щонайменше дві групи")
     stat, p = stats.f_oneway(*groups)
@@ -73,13 +100,24 @@ def run_anova(df: pd.DataFrame, group_col: str,
 
 def run_kruskal(df: pd.DataFrame, group_col: str,
                 target_col: str) -> ResultDict:
-    """Performs Kruskal-Wallis H-test (non-parametric ANOVA)."""
-    groups = []
-    for g in df[group_col].dropna().unique():
-        groups.append(df[df[group_col] == g][target_col].astype(float))
-    if len(groups) < 2:
+    """Performs Kruskal-Wallis H-test (non-parametric ANOVA) on cached ranks."""
+    codes, groups = pd.factorize(df[group_col])
+    k = len(groups)
+    if k < 2:
         raise ValueError("Kruskal вимагає щонайменше дві групи")
-    stat, p = stats.kruskal(*groups)
+    mask = codes >= 0
+    ranks, tie_term, has_nan = column_ranks(df, target_col, mask)
+    if has_nan:
+        stat = p = float("nan")
+    else:
+        # Суми рангів по групах за один прохід
+        n_j = np.bincount(codes[mask], minlength=k)
+        r_j = np.bincount(codes[mask], weights=ranks[mask], minlength=k)
+        n = int(n_j.sum())
+        stat = 12.0 / (n * (n + 1)) * np.sum(r_j ** 2 / n_j) - 3 * (n + 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stat /= 1 - tie_term / (n ** 3 - n)
+        p = stats.chi2.sf(stat, k - 1)
     return {
         "test": "kruskal",
         "statistic": float(stat),
@@ -0,0 +1,18 @@
+from .design import parse_formula, DesignSpec
+from .regression import (
+    fit_ols,
+    fit_logit,
+    run_model_preset,
+    format_model_summary,
+    MODEL_FUNCTIONS
+)
+
+__all__ = [
+    "parse_formula",
+    "DesignSpec",
+    "fit_ols",
+    "fit_logit",
+    "run_model_preset",
+    "format_model_summary",
+    "MODEL_FUNCTIONS",
+]
@@ -0,0 +1,111 @@
+from collections.abc import Iterator
+from pathlib import Path
+import re
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+DEFAULT_CHUNKSIZE = 5000
+_FACTOR_RE = re.compile(r"^C\((.+)\)$")
+
+
+def parse_formula(formula: str) -> tuple[str, list[dict]]:
+    """
+    Parses a simple additive formula 'y ~ a + b + C(c)'.
+    Returns the response name and a list of terms {"name", "column", "kind"};
+    kind is None until the column type is detected.
+    """
+    if "~" not in formula:
+        raise ValueError(f"Формула повинна мати вигляд 'y ~ x1 + x2', отримано {formula!r}")
+    lhs, rhs = formula.split("~", 1)
+    response = lhs.strip()
+    terms = []
+    for raw in rhs.split("+"):
+        name = raw.strip()
+        if not name:
+            continue
+        match = _FACTOR_RE.match(name)
+        if match:
+            terms.append({"name": name, "column": match.group(1).strip(), "kind": "factor"})
+        else:
+            terms.append({"name": name, "column": name, "kind": None})
+    if not response or not terms:
+        raise ValueError(f"Некоректна формула {formula!r}")
+    return response, terms
+
+
+def iter_chunks(data: pd.DataFrame | Path | str, columns: list[str],
+                chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yields chunks with only the used columns and without rows that have missing values."""
+    if isinstance(data, pd.DataFrame):
+        for start in range(0, len(data), chunksize):
+            yield data.iloc[start:start + chunksize][columns].dropna()
+    else:
+        # CSV читається частинами, у пам'яті тільки один chunk
+        for chunk in pd.read_csv(Path(data), usecols=columns, chunksize=chunksize):
+            yield chunk[columns].dropna()
+
+
+class DesignSpec:
+    """Column layout of a sparse design matrix: intercept, covariates and one-hot factors."""
+
+    def __init__(self, data: pd.DataFrame | Path | str, formula: str,
+                 chunksize: int = DEFAULT_CHUNKSIZE) -> None:
+        self.response, self.terms = parse_formula(formula)
+        self.columns = list(dict.fromkeys(
+            [self.response] + [t["column"] for t in self.terms]))
+        self.chunksize = chunksize
+        self._scan(data)
+
+    def _scan(self, data: pd.DataFrame | Path | str) -> None:
+        """First pass: detects term types and collects factor levels."""
+        levels: dict[str, set] = {}
+        for chunk in iter_chunks(data, self.columns, self.chunksize):
+            for term in self.terms:
+                col = chunk[term["column"]]
+                if term["kind"] is None:
+                    term["kind"] = ("numeric" if pd.api.types.is_numeric_dtype(col)
+                                    else "factor")
+                if term["kind"] == "factor":
+                    levels.setdefault(term["name"], set()).update(pd.unique(col))
+        self.column_names = ["Intercept"]
+        self.term_slices: dict[str, slice] = {}
+        for term in self.terms:
+            start = len(self.column_names)
+            if term["kind"] == "factor":
+                # Перший рівень (за сортуванням) є базовим і не кодується
+                term["levels"] = sorted(levels.get(term["name"], set()))
+                self.column_names += [f"{term['name']}[T.{lvl}]" for lvl in term["levels"][1:]]
+            else:
+                term["kind"] = term["kind"] or "numeric"
+                self.column_names.append(term["name"])
+            self.term_slices[term["name"]] = slice(start, len(self.column_names))
+
+    @property
+    def n_columns(self) -> int:
+        return len(self.column_names)
+
+    def transform(self, chunk: pd.DataFrame) -> tuple[sparse.csr_matrix, np.ndarray]:
+        """Encodes a cleaned chunk into a sparse CSR design matrix and a response vector."""
+        m = len(chunk)
+        blocks = [sparse.csr_matrix(np.ones((m, 1)))]
+        for term in self.terms:
+            values = chunk[term["column"]]
+            if term["kind"] == "factor":
+                codes = pd.Categorical(values, categories=term["levels"]).codes
+                rows = np.flatnonzero(codes > 0)
+                blocks.append(sparse.csr_matrix(
+                    (np.ones(len(rows)), (rows, codes[rows] - 1)),
+                    shape=(m, len(term["levels"]) - 1)))
+            else:
+                blocks.append(sparse.csr_matrix(values.to_numpy(dtype=float).reshape(-1, 1)))
+        X = sparse.hstack(blocks, format="csr")
+        y = chunk[self.response].to_numpy(dtype=float)
+        return X, y
+
+    def iter_design(self, data: pd.DataFrame | Path | str
+                    ) -> Iterator[tuple[sparse.csr_matrix, np.ndarray]]:
+        """Second pass: yields encoded (X, y) chunks."""
+        for chunk in iter_chunks(data, self.columns, self.chunksize):
+            if len(chunk):
+                yield self.transform(chunk)
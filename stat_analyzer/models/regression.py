@@ -0,0 +1,250 @@
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from scipy import special, stats
+from .design import DEFAULT_CHUNKSIZE, DesignSpec
+
+ModelResult = dict[str, object]
+
+
+def _pinv_sym(a: np.ndarray) -> tuple[np.ndarray, int]:
+    """Pseudo-inverse and rank of a symmetric PSD matrix after diagonal equilibration."""
+    d = np.sqrt(np.diag(a))
+    d[d == 0] = 1.0
+    scaled = a / np.outer(d, d)
+    # Масштабування прибирає погану обумовленість від колонок типу Year ~ 2000
+    inv = np.linalg.pinv(scaled, hermitian=True)
+    rank = int(np.linalg.matrix_rank(scaled, hermitian=True))
+    return inv / np.outer(d, d), rank
+
+
+def _ssr_without(xtx: np.ndarray, xty: np.ndarray, yty: float,
+                 keep: np.ndarray) -> tuple[float, int]:
+    """Residual sum of squares and rank of the model restricted to the kept columns."""
+    inv, rank = _pinv_sym(xtx[np.ix_(keep, keep)])
+    beta = inv @ xty[keep]
+    return max(yty - float(beta @ xty[keep]), 0.0), rank
+
+
+def fit_ols(data: pd.DataFrame | Path | str, formula: str,
+            chunksize: int = DEFAULT_CHUNKSIZE) -> ModelResult:
+    """
+    Fits OLS / ANCOVA from streamed sufficient statistics X'X, X'y, y'y.
+    Factors are one-hot encoded as sparse chunks, so no dense design is built.
+    """
+    spec = DesignSpec(data, formula, chunksize)
+    p = spec.n_columns
+    xtx = np.zeros((p, p))
+    xty = np.zeros(p)
+    yty = 0.0
+    y_sum = 0.0
+    n = 0
+    for X, y in spec.iter_design(data):
+        xtx += (X.T @ X).toarray()
+        xty += X.T @ y
+        yty += float(y @ y)
+        y_sum += float(y.sum())
+        n += len(y)
+    if n == 0:
+        raise ValueError(f"Немає повних рядків для моделі {formula!r}")
+
+    xtx_inv, rank = _pinv_sym(xtx)
+    beta = xtx_inv @ xty
+    ssr = max(yty - float(beta @ xty), 0.0)
+    tss = yty - y_sum ** 2 / n
+    df_model = rank - 1
+    df_resid = n - rank
+    scale = ssr / df_resid if df_resid > 0 else float("nan")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bse = np.sqrt(np.clip(np.diag(xtx_inv), 0.0, None) * scale)
+        tvalues = beta / bse
+        fvalue = ((tss - ssr) / df_model) / scale if df_model > 0 else float("nan")
+    pvalues = 2 * stats.t.sf(np.abs(tvalues), df_resid)
+    f_pvalue = stats.f.sf(fvalue, df_model, df_resid)
+
+    # ANCOVA: F тест для кожного терму через X'X без його колонок
+    rows = []
+    for name, cols in spec.term_slices.items():
+        keep = np.ones(p, dtype=bool)
+        keep[cols] = False
+        ssr_reduced, rank_reduced = _ssr_without(xtx, xty, yty, keep)
+        df_term = rank - rank_reduced
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f_term = ((ssr_reduced - ssr) / df_term) / scale
+        rows.append((name, ssr_reduced - ssr, df_term, f_term,
+                     stats.f.sf(f_term, df_term, df_resid)))
+    rows.append(("Residual", ssr, df_resid, float("nan"), float("nan")))
+    anova = pd.DataFrame(rows, columns=["term", "sum_sq", "df", "F", "PR(>F)"]).set_index("term")
+
+    names = spec.column_names
+    return {
+        "test": "ols",
+        "statistic": float(fvalue),
+        "p_value": float(f_pvalue),
+        "formula": formula,
+        "nobs": n,
+        "df_model": df_model,
+        "df_resid": df_resid,
+        "rsquared": 1 - ssr / tss if tss > 0 else float("nan"),
+        "rsquared_adj": 1 - (ssr / df_resid) / (tss / (n - 1)) if tss > 0 and df_resid > 0 else float("nan"),
+        "params": pd.Series(beta, index=names),
+        "bse": pd.Series(bse, index=names),
+        "pvalues": pd.Series(pvalues, index=names),
+        "anova": anova,
+    }
+
+
+def _separated_indicators(chunks: list[tuple], p: int) -> np.ndarray:
+    """0/1 columns (except the intercept) whose rows all share one response value."""
+    col_n = np.zeros(p)
+    col_y = np.zeros(p)
+    indicator = np.ones(p, dtype=bool)
+    for X, y in chunks:
+        col_n += np.asarray((X != 0).sum(axis=0)).ravel()
+        col_y += X.T @ y
+        indicator &= np.asarray((X.multiply(X) != X).sum(axis=0)).ravel() == 0
+    separated = indicator & (col_n > 0) & ((col_y == 0) | (col_y == col_n))
+    separated[0] = False
+    return separated
+
+
+def fit_logit(data: pd.DataFrame | Path | str, formula: str,
+              threshold: float | None = None,
+              chunksize: int = DEFAULT_CHUNKSIZE,
+              maxiter: int = 35, tol: float = 1e-8,
+              max_bse: float = 50.0) -> ModelResult:
+    """
+    Fits a logistic regression by Newton-Raphson on streamed X'WX and X'(y - mu).
+    With threshold the response is binarized as y > threshold, otherwise it must be 0/1.
+    Indicator columns that perfectly separate the response are dropped together with
+    their rows before fitting; they and any column with std err above max_bse are
+    listed in 'separated' with NaN estimates / p-values.
+    """
+    spec = DesignSpec(data, formula, chunksize)
+    # Розріджені chunk'и займають O(nnz) пам'яті і перевикористовуються між ітераціями
+    chunks = []
+    for X, y in spec.iter_design(data):
+        if threshold is not None:
+            y = (y > threshold).astype(float)
+        elif not np.isin(y, (0.0, 1.0)).all():
+            raise ValueError("Logit вимагає бінарну відповідь 0/1 або параметр threshold")
+        chunks.append((X, y))
+
+    # Рівні з однаковою відповіддю мають MLE у нескінченності: прибираємо їх
+    # разом з рядками (повторно, бо після цього можуть з'явитися нові такі рівні)
+    p_full = spec.n_columns
+    dropped = np.zeros(p_full, dtype=bool)
+    while True:
+        new = _separated_indicators(chunks, p_full) & ~dropped
+        if not new.any():
+            break
+        dropped |= new
+        chunks = [(X[rows], y[rows]) for X, y in chunks
+                  for rows in [np.asarray(X[:, new].getnnz(axis=1) == 0)]]
+    keep = ~dropped
+    chunks = [(X[:, keep], y) for X, y in chunks if len(y)]
+    n = sum(len(y) for _, y in chunks)
+    if n == 0:
+        raise ValueError(f"Немає повних рядків для моделі {formula!r}")
+
+    p = int(keep.sum())
+    beta = np.zeros(p)
+    converged = False
+    llf_prev = -np.inf
+    for _ in range(maxiter):
+        hessian = np.zeros((p, p))
+        score = np.zeros(p)
+        llf = 0.0
+        for X, y in chunks:
+            eta = X @ beta
+            mu = special.expit(eta)
+            w = mu * (1 - mu)
+            hessian += (X.T @ X.multiply(w[:, None])).toarray()
+            score += X.T @ (y - mu)
+            llf += float(np.sum(y * eta - np.logaddexp(0.0, eta)))
+        hessian_inv, rank = _pinv_sym(hessian)
+        step = hessian_inv @ score
+        # Збіжність вимагає і стабільного log-likelihood, і малого кроку: при
+        # квазі-розділенні llf майже не змінюється, а коефіцієнти ростуть безмежно
+        if abs(llf - llf_prev) < tol * (abs(llf) + 1) and np.max(np.abs(step)) < np.sqrt(tol):
+            converged = True
+            break
+        llf_prev = llf
+        beta += step
+
+    y_sum = sum(float(y.sum()) for _, y in chunks)
+    y_mean = y_sum / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        llnull = float(special.xlogy(y_sum, y_mean) + special.xlogy(n - y_sum, 1 - y_mean))
+        bse_kept = np.sqrt(np.clip(np.diag(hessian_inv), 0.0, None))
+    # Повертаємо повний набір колонок; прибрані отримують NaN
+    params = np.full(p_full, np.nan)
+    bse = np.full(p_full, np.nan)
+    params[keep] = beta
+    bse[keep] = bse_kept
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pvalues = 2 * stats.norm.sf(np.abs(params / bse))
+    separated_mask = dropped.copy()
+    separated_mask[keep] |= ~np.isfinite(bse_kept) | (bse_kept > max_bse)
+    pvalues[separated_mask] = np.nan
+    df_model = rank - 1
+    llr = 2 * (llf - llnull)
+
+    names = spec.column_names
+    return {
+        "test": "logit",
+        "statistic": float(llr),
+        "p_value": float(stats.chi2.sf(llr, df_model)),
+        "formula": formula,
+        "nobs": n,
+        "df_model": df_model,
+        "df_resid": n - rank,
+        "llf": llf,
+        "llnull": llnull,
+        "prsquared": 1 - llf / llnull if llnull else float("nan"),
+        "converged": converged,
+        "separated": [name for name, flag in zip(names, separated_mask) if flag],
+        "params": pd.Series(params, index=names),
+        "bse": pd.Series(bse, index=names),
+        "pvalues": pd.Series(pvalues, index=names),
+    }
+
+
+MODEL_FUNCTIONS = {
+    "ols": fit_ols,
+    "ancova": fit_ols,
+    "logit": fit_logit,
+}
+
+
+def run_model_preset(df: pd.DataFrame | Path | str, hypothesis: dict) -> ModelResult:
+    """Fits the model described by a preset with keys 'model', 'formula' and optional 'threshold'."""
+    model = hypothesis.get("model", "ols")
+    if model not in MODEL_FUNCTIONS:
+        raise ValueError(f"Невідома модель {model!r}")
+    kwargs = {}
+    if hypothesis.get("threshold") is not None:
+        kwargs["threshold"] = hypothesis["threshold"]
+    return MODEL_FUNCTIONS[model](df, hypothesis["formula"], **kwargs)
+
+
+def format_model_summary(result: ModelResult, top_n: int = 10) -> str:
+    """Formats fit quality, the term table and the strongest coefficients."""
+    lines = [f"Модель: {result['formula']}", f"Спостережень: {result['nobs']}"]
+    if result["test"] == "logit":
+        lines.append(f"Pseudo R^2: {result['prsquared']:.4f}"
+                     + ("" if result["converged"] else " (не зійшлося)"))
+        if result["separated"]:
+            lines.append("Розділення даних, ці рівні та їхні рядки виключені з моделі: "
+                         + ", ".join(result["separated"]))
+    else:
+        lines.append(f"R^2: {result['rsquared']:.4f}, adj. R^2: {result['rsquared_adj']:.4f}")
+        lines.append(result["anova"].to_string(float_format=lambda v: f"{v:.4f}"))
+    coefs = pd.DataFrame({"coef": result["params"], "std err": result["bse"],
+                          "p value": result["pvalues"]})
+    top = (coefs.drop(index=["Intercept"] + result.get("separated", []))
+           .sort_values("p value").head(top_n))
+    lines.append(f"Найзначущіші коефіцієнти (топ {top_n}):")
+    lines.append(top.to_string(float_format=lambda v: f"{v:.4f}"))
+    return "\n".join(lines)
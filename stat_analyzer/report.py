@@ -0,0 +1,374 @@
+import argparse
+import base64
+import hashlib
+import html
+import io
+import json
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import Connection, wait
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+import matplotlib.pyplot as plt
+import pandas as pd
+from .config import PROCESSED_DATA_FILE, PROCESSED_SCHEMA_FILE, REPORTS_DIR, REPORT_CACHE_DIR
+from .cleaning import load_clean_data, load_processed_data
+from .eda import basic_info, numerical_summary, categorical_summary, correlation_matrix
+from .hypothesis_tests import HYPOTHESES, run_all_presets
+from .models import parse_formula
+from .hypothesis_tests.plots import (
+    plot_histogram,
+    plot_boxplot,
+    plot_correlation_heatmap,
+    plot_bar_counts,
+    plot_pairplot,
+)
+
+PLOT_FUNCTIONS = {
+    "histogram": plot_histogram,
+    "boxplot": plot_boxplot,
+    "heatmap": plot_correlation_heatmap,
+    "bar_counts": plot_bar_counts,
+    "pairplot": plot_pairplot,
+}
+
+DEFAULT_PLOTS = [
+    {"name": "hist_global_sales", "plot": "histogram", "column": "Global_Sales"},
+    {"name": "box_global_sales", "plot": "boxplot", "column": "Global_Sales"},
+    {"name": "correlation_heatmap", "plot": "heatmap"},
+    {"name": "bar_genre", "plot": "bar_counts", "column": "Genre"},
+    {"name": "bar_platform", "plot": "bar_counts", "column": "Platform"},
+]
+
+# Модулі, від яких залежить результат кожного розділу; зміна інших не інвалідує кеш
+TASK_SOURCES = {
+    "eda": ["eda.py"],
+    "preset": ["hypothesis_tests/detectors.py", "hypothesis_tests/tests.py",
+               "hypothesis_tests/ranks.py", "hypothesis_tests/runner.py", "models"],
+    "plot": ["hypothesis_tests/plots.py"],
+}
+
+SECTION_TITLES = {
+    "eda": "Базовий EDA",
+    "preset": "Наперед задані гіпотези",
+    "plot": "Графіки",
+}
+
+# Датасет, завантажений у процесі задачі
+_WORKER_DF: pd.DataFrame | None = None
+
+
+def default_tasks(presets: list[dict] = HYPOTHESES,
+                  plots: list[dict] = DEFAULT_PLOTS) -> list[dict]:
+    """Builds the independent report tasks: EDA, one task per preset and per plot."""
+    tasks = [{"section": "eda", "name": "basic_eda", "spec": {}}]
+    tasks += [{"section": "preset", "name": p.get("name", str(p.get("cols"))), "spec": p}
+              for p in presets]
+    tasks += [{"section": "plot", "name": p["name"], "spec": p} for p in plots]
+    return tasks
+
+
+def _init_worker(data_path: str, schema_path: str) -> None:
+    """Worker setup: headless matplotlib and one typed load of the dataset."""
+    global _WORKER_DF
+    plt.switch_backend("Agg")
+    _WORKER_DF = load_processed_data(data_path, schema_path)
+
+
+def _eda_text(df: pd.DataFrame) -> str:
+    """Same content as the CLI basic EDA, captured as text."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        basic_info(df)
+        print("\n=== Описова статистика для числових змінних ===")
+        print(numerical_summary(df).to_string())
+        print("\n=== Частоти для категоріальних змінних (топ 5) ===")
+        for col, vc in categorical_summary(df).items():
+            print(f"\nКолонка: {col}")
+            print(vc.to_string())
+        print("\n=== Кореляційна матриця для числових змінних ===")
+        print(correlation_matrix(df).to_string())
+    return buf.getvalue()
+
+
+def _plot_png(df: pd.DataFrame, spec: dict) -> str:
+    """Renders a plot spec to a base64 PNG."""
+    kwargs = {k: v for k, v in spec.items() if k not in ("name", "plot")}
+    fig = PLOT_FUNCTIONS[spec["plot"]](df, show=False, **kwargs)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+    plt.close(fig)
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def _run_task(task: dict) -> dict:
+    """Executes one task in a worker; errors become an 'error' artifact instead of failing the report."""
+    start = time.perf_counter()
+    df = _WORKER_DF
+    try:
+        if task["section"] == "eda":
+            kind, content = "text", _eda_text(df)
+        elif task["section"] == "preset":
+            kind, content = "text", "\n".join(run_all_presets(df, [task["spec"]]))
+        else:
+            kind, content = "image", _plot_png(df, task["spec"])
+    except Exception as e:
+        kind, content = "error", f"{type(e).__name__}: {e}"
+    return {"kind": kind, "content": content, "seconds": time.perf_counter() - start}
+
+
+def _task_process(task: dict, data_path: str, schema_path: str, conn: Connection) -> None:
+    """Entry point of a task process: sends the artifact back through the pipe."""
+    start = time.perf_counter()
+    try:
+        _init_worker(data_path, schema_path)
+        result = _run_task(task)
+    except Exception as e:
+        result = {"kind": "error", "content": f"{type(e).__name__}: {e}",
+                  "seconds": time.perf_counter() - start}
+    conn.send(result)
+    conn.close()
+
+
+def _source_hash(section: str) -> str:
+    """Hash of the package modules a section depends on (directories are hashed recursively)."""
+    root = Path(__file__).parent
+    h = hashlib.sha256()
+    for rel in TASK_SOURCES[section]:
+        path = root / rel
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for src in files:
+            h.update(str(src.relative_to(root)).encode("utf-8"))
+            h.update(src.read_bytes())
+    return h.hexdigest()
+
+
+def _task_columns(task: dict) -> list[str] | None:
+    """Data columns a task reads, or None if it reads the whole dataset."""
+    spec = task["spec"]
+    if task["section"] == "preset":
+        if "formula" in spec:
+            response, terms = parse_formula(spec["formula"])
+            return [response] + [t["column"] for t in terms]
+        return list(spec["cols"])
+    if task["section"] == "plot":
+        if spec.get("column"):
+            return [spec["column"]]
+        if spec.get("columns"):
+            return list(spec["columns"])
+    return None
+
+
+def _data_hash(df: pd.DataFrame, columns: list[str] | None) -> str:
+    """Hash of the values and dtypes of the given columns (all columns if None)."""
+    data = df if columns is None else df[sorted(set(columns))]
+    h = hashlib.sha256(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    h.update(json.dumps({c: str(t) for c, t in data.dtypes.items()}).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _task_key(task: dict, df: pd.DataFrame, memo: dict) -> str:
+    """Cache key from the task spec, the sources of its section and the data it reads."""
+    columns = _task_columns(task)
+    memo_key = (task["section"], tuple(columns) if columns is not None else None)
+    if memo_key not in memo:
+        memo[memo_key] = _source_hash(task["section"]) + _data_hash(df, columns)
+    payload = json.dumps(task, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256((payload + memo[memo_key]).encode("utf-8")).hexdigest()[:24]
+
+
+def _read_cached(path: Path) -> dict | None:
+    """Cached artifact or None; an unreadable or truncated file counts as a cache miss."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            artifact = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(artifact, dict) or not {"kind", "content", "seconds"} <= artifact.keys():
+        return None
+    return artifact
+
+
+def _write_cached(path: Path, artifact: dict) -> None:
+    """Writes through a temporary file so an interrupted run never leaves a partial entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(artifact, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def run_tasks(tasks: list[dict],
+              data_path: Path | str = PROCESSED_DATA_FILE,
+              schema_path: Path | str = PROCESSED_SCHEMA_FILE,
+              workers: int | None = None,
+              timeout: float | None = None,
+              cache_dir: Path | str | None = REPORT_CACHE_DIR) -> list[dict]:
+    """
+    Runs tasks in at most `workers` parallel processes, reusing cached artifacts of unchanged tasks.
+    Each task gets its own process, so after timeout seconds unfinished tasks are terminated
+    and reported as 'timeout'; a crashed process becomes an 'error' artifact.
+    Returns artifacts in task order, each with 'status': computed | cached | error | timeout.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    df = load_processed_data(data_path, schema_path) if cache_dir is not None else None
+    memo: dict = {}
+    artifacts: list[dict | None] = [None] * len(tasks)
+    pending = {}
+    for i, task in enumerate(tasks):
+        key = _task_key(task, df, memo) if cache_dir is not None else None
+        cached = cache_dir / f"{key}.json" if cache_dir is not None else None
+        artifact = _read_cached(cached) if cached is not None else None
+        if artifact is not None:
+            artifacts[i] = {**artifact, "status": "cached"}
+        else:
+            pending[i] = cached
+
+    ctx = multiprocessing.get_context()
+    workers = workers or os.cpu_count() or 1
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    queue = list(pending)
+    running: dict[int, tuple] = {}
+    while queue or running:
+        while queue and len(running) < workers:
+            i = queue.pop(0)
+            recv, send = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_task_process, daemon=True,
+                               args=(tasks[i], str(data_path), str(schema_path), send))
+            proc.start()
+            # Закриття копії send у батьківському процесі дає EOF, якщо воркер впаде
+            send.close()
+            running[i] = (proc, recv, time.perf_counter())
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            break
+        ready = wait([recv for _, recv, _ in running.values()], timeout=remaining)
+        for i, (proc, recv, started) in list(running.items()):
+            if recv not in ready:
+                continue
+            try:
+                result = recv.recv()
+            except EOFError:
+                proc.join()
+                result = {"kind": "error", "seconds": time.perf_counter() - started,
+                          "content": f"Процес задачі завершився з кодом {proc.exitcode}"}
+            proc.join()
+            recv.close()
+            del running[i]
+            artifacts[i] = {**result, "status": "error" if result["kind"] == "error" else "computed"}
+            # Помилки не кешуються, щоб наступний запуск спробував ще раз
+            if pending[i] is not None and result["kind"] != "error":
+                _write_cached(pending[i], result)
+
+    # Дедлайн: зупиняємо задачі, що ще виконуються, і не запускаємо решту
+    for i, (proc, recv, started) in running.items():
+        proc.terminate()
+        proc.join()
+        recv.close()
+        artifacts[i] = {"kind": "error", "status": "timeout",
+                        "seconds": time.perf_counter() - started,
+                        "content": f"Зупинено після ліміту {timeout} с"}
+    for i in queue:
+        artifacts[i] = {"kind": "error", "status": "timeout", "seconds": 0.0,
+                        "content": f"Не запущено до ліміту {timeout} с"}
+    return artifacts
+
+
+def render_html(tasks: list[dict], artifacts: list[dict], title: str, wall_time: float) -> str:
+    """Self-contained HTML: text in <pre>, figures embedded as data URIs."""
+    parts = [f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>",
+             "<style>body{font-family:sans-serif;max-width:1100px;margin:auto}"
+             "pre{background:#f6f8fa;padding:8px;overflow-x:auto}"
+             "table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}"
+             ".error{color:#b00}</style></head><body>",
+             f"<h1>{html.escape(title)}</h1>"]
+    section = None
+    for task, art in zip(tasks, artifacts):
+        if task["section"] != section:
+            section = task["section"]
+            parts.append(f"<h2>{SECTION_TITLES[section]}</h2>")
+        parts.append(f"<h3>{html.escape(task['name'])}</h3>")
+        if art["kind"] == "image":
+            parts.append(f"<img alt='{html.escape(task['name'])}' "
+                         f"src='data:image/png;base64,{art['content']}'>")
+        elif art["kind"] == "error":
+            parts.append(f"<pre class='error'>{html.escape(art['content'])}</pre>")
+        else:
+            parts.append(f"<pre>{html.escape(art['content'])}</pre>")
+    parts.append("<h2>Додаток: час виконання</h2><table>"
+                 "<tr><th>Задача</th><th>Розділ</th><th>Секунди</th><th>Статус</th></tr>")
+    for task, art in zip(tasks, artifacts):
+        parts.append(f"<tr><td>{html.escape(task['name'])}</td><td>{task['section']}</td>"
+                     f"<td>{art['seconds']:.2f}</td><td>{art['status']}</td></tr>")
+    parts.append(f"</table><p>Загальний час: {wall_time:.2f} с</p></body></html>")
+    return "\n".join(parts)
+
+
+def render_markdown(tasks: list[dict], artifacts: list[dict], title: str, wall_time: float) -> str:
+    """Markdown report with figures embedded as data URIs."""
+    parts = [f"# {title}"]
+    section = None
+    for task, art in zip(tasks, artifacts):
+        if task["section"] != section:
+            section = task["section"]
+            parts.append(f"## {SECTION_TITLES[section]}")
+        parts.append(f"### {task['name']}")
+        if art["kind"] == "image":
+            parts.append(f"![{task['name']}](data:image/png;base64,{art['content']})")
+        else:
+            parts.append(f"```\n{art['content']}\n```")
+    parts.append("## Додаток: час виконання")
+    rows = [f"| {task['name']} | {task['section']} | {art['seconds']:.2f} | {art['status']} |"
+            for task, art in zip(tasks, artifacts)]
+    parts.append("\n".join(["| Задача | Розділ | Секунди | Статус |", "|---|---|---|---|"] + rows))
+    parts.append(f"\nЗагальний час: {wall_time:.2f} с")
+    return "\n\n".join(parts)
+
+
+def build_report(out_path: Path | str | None = None,
+                 fmt: str = "html",
+                 tasks: list[dict] | None = None,
+                 workers: int | None = None,
+                 timeout: float | None = None,
+                 use_cache: bool = True) -> Path:
+    """Runs all report tasks in parallel and writes one self-contained HTML or Markdown file."""
+    if fmt not in ("html", "md"):
+        raise ValueError(f"Невідомий формат звіту {fmt!r}")
+    start = time.perf_counter()
+    # Гарантує наявність очищеного датасету перед запуском воркерів
+    load_clean_data()
+    tasks = tasks if tasks is not None else default_tasks()
+    artifacts = run_tasks(tasks, workers=workers, timeout=timeout,
+                          cache_dir=REPORT_CACHE_DIR if use_cache else None)
+    title = f"Звіт аналізу vgsales ({datetime.now():%Y-%m-%d %H:%M})"
+    render = render_html if fmt == "html" else render_markdown
+    text = render(tasks, artifacts, title, time.perf_counter() - start)
+    out_path = Path(out_path) if out_path is not None else REPORTS_DIR / f"report.{fmt}"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(text, encoding="utf-8")
+    return out_path
+
+
+def main() -> None:
+    """Command line entry point for scheduled report builds."""
+    parser = argparse.ArgumentParser(description="Генерація звіту аналізу vgsales")
+    parser.add_argument("--format", choices=["html", "md"], default="html")
+    parser.add_argument("--out", default=None, help="шлях до файлу звіту")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=None, help="ліміт часу в секундах")
+    parser.add_argument("--pairplot", action="store_true", help="додати повільний pairplot")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+    plots = DEFAULT_PLOTS + ([{"name": "pairplot", "plot": "pairplot"}] if args.pairplot else [])
+    path = build_report(args.out, args.format, default_tasks(plots=plots),
+                        args.workers, args.timeout, not args.no_cache)
+    print(f"Звіт збережено: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+import statsmodels.formula.api as smf
+from stat_analyzer.eda import load_data
+from stat_analyzer.models import fit_ols, fit_logit
+
+FORMULA = "Global_Sales ~ Genre + Platform + Year"
+
+
+def test_fit_ols_matches_statsmodels():
+    """Streamed X'X fit reproduces smf.ols estimates and the type II ANOVA table."""
+    df = load_data()
+    result = fit_ols(df, FORMULA, chunksize=3000)
+    expected = smf.ols(FORMULA, df).fit()
+
+    assert result["nobs"] == expected.nobs
+    assert np.allclose(result["params"].reindex(expected.params.index), expected.params, atol=1e-6)
+    assert np.allclose(result["bse"].reindex(expected.bse.index), expected.bse, atol=1e-6)
+    assert np.isclose(result["rsquared"], expected.rsquared)
+    assert np.isclose(result["statistic"], expected.fvalue)
+
+    table = sm.stats.anova_lm(expected, typ=2)
+    ours = result["anova"].reindex(table.index)
+    assert np.allclose(ours["sum_sq"], table["sum_sq"])
+    assert np.allclose(ours["df"], table["df"])
+    assert np.allclose(ours["F"], table["F"], equal_nan=True)
+
+
+def test_fit_logit_matches_statsmodels():
+    """Newton fit on streamed X'WX reproduces smf.logit when estimates are identified."""
+    df = load_data()
+    df["Hit"] = (df["Global_Sales"] > 1).astype(float)
+    formula = "Hit ~ Genre + Year"
+    result = fit_logit(df, formula, chunksize=3000)
+    expected = smf.logit(formula, df).fit(disp=0)
+
+    assert result["converged"] and not result["separated"]
+    assert np.allclose(result["params"].reindex(expected.params.index), expected.params, atol=1e-6)
+    assert np.allclose(result["bse"].reindex(expected.bse.index), expected.bse, atol=1e-6)
+    assert np.isclose(result["llf"], expected.llf)
+    assert np.isclose(result["statistic"], expected.llr)
+    assert np.isclose(result["p_value"], expected.llr_pvalue)
+
+
+def test_fit_logit_drops_separated_levels():
+    """Separated levels are excluded with their rows; the rest matches smf.logit on those rows."""
+    df = load_data()
+    result = fit_logit(df, FORMULA, threshold=1.0)
+    assert result["converged"]
+    levels = [name[len("Platform[T."):-1] for name in result["separated"]]
+    assert levels and all(name.startswith("Platform[T.") for name in result["separated"])
+
+    kept = df.dropna(subset=["Year"])
+    kept = kept[~kept["Platform"].isin(levels)].copy()
+    kept["Hit"] = (kept["Global_Sales"] > 1).astype(float)
+    expected = smf.logit("Hit ~ Genre + Platform + Year", kept).fit(disp=0)
+    assert result["nobs"] == expected.nobs
+    assert np.isclose(result["llf"], expected.llf)
+    assert pd.isna(result["params"][result["separated"]]).all()
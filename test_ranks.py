@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from stat_analyzer.eda import load_data
+from stat_analyzer.hypothesis_tests.ranks import clear_rank_cache
+from stat_analyzer.hypothesis_tests.tests import run_spearman, run_mannwhitney, run_kruskal
+
+
+def _groups(df, group_col, target_col):
+    return [df.loc[df[group_col] == g, target_col] for g in df[group_col].dropna().unique()]
+
+
+def _assert_parity(result, expected):
+    assert np.isclose(result["statistic"], expected[0], equal_nan=True)
+    assert np.isclose(result["p_value"], expected[1], equal_nan=True)
+
+
+def _check_all(df, group_col, target_col, other_col):
+    """Compares the cached rank tests with SciPy on the same frame."""
+    clear_rank_cache()
+    groups = _groups(df, group_col, target_col)
+    if len(groups) == 2:
+        _assert_parity(run_mannwhitney(df, group_col, target_col),
+                       stats.mannwhitneyu(*groups, alternative="two-sided"))
+    _assert_parity(run_kruskal(df, group_col, target_col), stats.kruskal(*groups))
+    _assert_parity(run_spearman(df, target_col, other_col),
+                   stats.spearmanr(df[target_col], df[other_col]))
+
+
+def test_rank_tests_match_scipy_on_vgsales():
+    """Heavily tied sales data with many groups and NaN group labels."""
+    df = load_data()
+    df["Two"] = df["Genre"].where(df["Genre"].isin(["Action", "Sports"]))
+    _check_all(df, "Two", "Global_Sales", "NA_Sales")
+    _check_all(df, "Platform", "JP_Sales", "EU_Sales")
+
+
+def test_rank_tests_match_scipy_small_exact():
+    """n <= 8 without ties: Mann-Whitney uses the exact distribution."""
+    df = pd.DataFrame({"g": list("abababa"),
+                       "x": [3.1, 1.2, 5.7, 0.4, 2.2, 9.9, 4.4],
+                       "y": [1.0, 2.0, 0.5, 7.0, 3.0, 4.0, 6.0]})
+    _check_all(df, "g", "x", "y")
+
+
+def test_rank_tests_match_scipy_small_with_ties():
+    """n <= 8 with ties: Mann-Whitney falls back to the asymptotic method."""
+    df = pd.DataFrame({"g": list("aabbabab"),
+                       "x": [1.0, 2.0, 2.0, 3.0, 3.0, 3.0, 5.0, 1.0],
+                       "y": [2.0, 2.0, 1.0, 4.0, 4.0, 5.0, 0.0, 1.0]})
+    _check_all(df, "g", "x", "y")
+
+
+def test_rank_tests_nan_group_labels():
+    """Rows with a missing group label are excluded, as with dropna().unique()."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"g": rng.choice(["a", "b", None], size=200),
+                       "x": rng.integers(0, 10, size=200).astype(float),
+                       "y": rng.normal(size=200)})
+    _check_all(df, "g", "x", "y")
+    df["g3"] = rng.choice(["a", "b", "c", None], size=200)
+    _check_all(df, "g3", "x", "y")
+
+
+def test_rank_cache_invalidated_on_inplace_change():
+    """Rank-based tests must see in-place edits of the DataFrame, not stale cached ranks."""
+    df = load_data()
+    run_spearman(df, "NA_Sales", "EU_Sales")
+    run_kruskal(df, "Genre", "NA_Sales")
+    df.loc[df.index[:5000], "NA_Sales"] = 0.0
+
+    expected = stats.spearmanr(df["NA_Sales"], df["EU_Sales"])
+    result = run_spearman(df, "NA_Sales", "EU_Sales")
+    assert np.isclose(result["statistic"], expected[0])
+    assert np.isclose(result["p_value"], expected[1])
+
+    groups = [df.loc[df["Genre"] == g, "NA_Sales"] for g in df["Genre"].dropna().unique()]
+    expected = stats.kruskal(*groups)
+    result = run_kruskal(df, "Genre", "NA_Sales")
+    assert np.isclose(result["statistic"], expected[0])
+
+
+if __name__ == "__main__":
+    test_rank_cache_invalidated_on_inplace_change()
+    print("OK")